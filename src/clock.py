@@ -1,7 +1,9 @@
+import itertools
 import os
 import time
 import logging
 from datetime import datetime
+import numpy as np
 import pytz
 from typing import Dict, Any, Optional
 from src.config_manager import ConfigManager
@@ -11,6 +13,14 @@ from PIL import Image, ImageDraw
 # Get logger without configuring
 logger = logging.getLogger(__name__)
 
+# Precomputed at import so the display path does a tuple index instead of
+# modulo chains, dict lookups or strftime
+_ORDINAL = tuple('th' if 10 <= d % 100 <= 20 else {1: 'st', 2: 'nd', 3: 'rd'}.get(d % 10, 'th')
+                 for d in range(32))
+_WEEKDAYS = ('MON', 'TUE', 'WED', 'THU', 'FRI', 'SAT', 'SUN')
+_MONTHS = ('JAN', 'FEB', 'MAR', 'APR', 'MAY', 'JUN',
+           'JUL', 'AUG', 'SEP', 'OCT', 'NOV', 'DEC')
+
 class Clock:
     def __init__(self, display_manager: DisplayManager = None):
         self.config_manager = ConfigManager()
@@ -27,10 +37,25 @@ class Clock:
         self.clock_config = self.config.get('clock', {})
         # Use configured timezone if available, otherwise try to determine it
         self.timezone = self._get_timezone()
+        # Bound method reference so the hot path skips the module attribute
+        # lookup on every call (utcnow is deprecated in 3.12+ but this runs
+        # on the Pi's 3.9/3.11 system Python; revisit alongside pytz)
+        self._utcnow = datetime.utcnow
+        # Cache the UTC offset so steady-state ticks skip pytz's DST table
+        # walk; get_current_time refreshes it when the minute rolls over.
+        # fromutc maps the UTC instant correctly - utcoffset() on a naive
+        # datetime would treat it as local wall time and flip the offset
+        # hours away from the real DST transition.
+        utc_now = self._utcnow()
+        self._tz_offset = self.timezone.fromutc(utc_now).utcoffset()
+        self._tz_offset_minute = utc_now.minute
         self.last_time = None
         self.last_date = None
+        self._last_digits = (-1, -1, -1, -1, None)
 
-        self._digit_cache = {}
+        self._rgb_cache = {}
+        self._sprite_arrs = {}
+        self._framebuffer = None
 
         # Colors for different elements - using super bright colors
         self.COLORS = {
@@ -87,6 +112,42 @@ class Clock:
         self.WEEKDAY_X = self.DATE_X + 5
         self.WEEKDAY_Y = self.MONTH_Y + self.Y_OFFSET_DATE + 2
 
+        # Eagerly load every digit/blank/separator sprite once so the display
+        # loop never touches the filesystem or resamples on the hot path
+        self._preload_clock_images()
+
+        # Pre-resolve filenames to sprite entries so the display path does a
+        # single tuple index instead of a list lookup plus a dict probe
+        self._digit_sprites = tuple(self._sprite_arrs.get(n) for n in self.NUMBER_IMAGES)
+        self._blank_ones = self._sprite_arrs.get("blank1s.png")
+        self._blank_tens = self._sprite_arrs.get("blank10s.png")
+        self._sep_sprite = self._sprite_arrs.get("timeseparator.png")
+        self._am_sprite = self._sprite_arrs.get("am.png")
+        self._pm_sprite = self._sprite_arrs.get("pm.png")
+        self.last_ampm = None
+
+    def _preload_clock_images(self) -> None:
+        """Load, resize and flatten all clock sprites into the RGB cache."""
+        for name in itertools.chain(self.NUMBER_IMAGES, self.BLANK_NUMS,
+                                    ("timeseparator.png", "am.png", "pm.png")):
+            try:
+                img = Image.open(os.path.join(self.clock_dir, name))
+                img.load()
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+                img.thumbnail((self.display_width, self.display_height), Image.Resampling.LANCZOS)
+                # The glyphs are opaque-on-black, so flatten the alpha once
+                # here and keep only the RGB sprite; the display path then
+                # pastes without a mask and never touches alpha again
+                rgb = Image.new('RGB', img.size)
+                rgb.paste(img, mask=img)
+                self._rgb_cache[name] = rgb
+                # uint8 HxWx3 array so damage updates are plain slice
+                # assignments into the framebuffer
+                self._sprite_arrs[name] = np.asarray(rgb, dtype=np.uint8)
+            except Exception as e:
+                logger.error(f"Error loading clock image {name}: {e}", exc_info=True)
+
     def _get_timezone(self) -> pytz.timezone:
         """Get timezone from the config file."""
         config_timezone = self.config_manager.get_timezone()
@@ -103,35 +164,34 @@ class Clock:
 
     def _get_ordinal_suffix(self, day: int) -> str:
         """Get the ordinal suffix for a day number (1st, 2nd, 3rd, etc.)."""
-        if 10 <= day % 100 <= 20:
-            suffix = 'th'
-        else:
-            suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-        return suffix
+        return _ORDINAL[day]
 
     def get_current_time(self) -> tuple:
         """Get the current time and date in the configured timezone."""
-        current = datetime.now(self.timezone)
-        
-        # Format time in 12-hour format with AM/PM
-        time_str = current.strftime('%-I:%M') 
-        
-        # Get AM/PM
-        ampm = current.strftime('%p')
-        
-        # # Format date with ordinal suffix - split into two lines
-        # day_suffix = self._get_ordinal_suffix(current.day)
-        # Full weekday on first line, full month and day on second line
-        weekday   = current.strftime('%a').upper()
-        month_str = current.strftime(f'%b').upper()
-        date_str  = current.strftime(f"%-d")
-        
-        return time_str, ampm, weekday, month_str, date_str
+        utc_now = self._utcnow()
+        if utc_now.minute != self._tz_offset_minute:
+            # Refresh at most once a minute: cheap, and it also covers the
+            # zones whose DST transitions fall on half-hour boundaries
+            self._tz_offset = self.timezone.fromutc(utc_now).utcoffset()
+            self._tz_offset_minute = utc_now.minute
+        current = utc_now + self._tz_offset
+
+        # Build the fields straight from the datetime attributes; strftime's
+        # format parser is measurable overhead on the Pi. Hour and minute
+        # stay integers so callers can split them without string parsing.
+        hour12 = ((current.hour - 1) % 12) + 1
+        ampm = 'AM' if current.hour < 12 else 'PM'
+        weekday   = _WEEKDAYS[current.weekday()]
+        month_str = _MONTHS[current.month - 1]
+        date_str  = str(current.day)
+
+        return hour12, current.minute, ampm, weekday, month_str, date_str
 
     def display_time_text(self, force_clear: bool = False) -> None:
         """Display the current time and date."""
-        time_str, ampm, weekday, month_str, date_str = self.get_current_time()
-        
+        hour12, minute, ampm, weekday, month_str, date_str = self.get_current_time()
+        time_str = f"{hour12}:{minute:02d}"
+
         # Only update if something has changed
         if time_str != self.last_time or date_str != self.last_date or force_clear:
             # Clear the display
@@ -185,174 +245,139 @@ class Clock:
             self.last_time = time_str
             self.last_date = date_str
 
-    def time_str_to_decimal(self, time_str) -> tuple:
-        if time_str is None:
-            return -1, -1, -1, -1 # return default value if initial time check
-
-        fields = time_str.split(":")
-        hour = int(fields[0]) if len(fields) > 0 else 0
-        minute = int(fields[1]) if len(fields) > 1 else 0
-
-        # return 10s and 1s place for hours and minutes
-        hour_tens = hour // 10
-        hour_ones = hour % 10
-        minute_tens = minute // 10
-        minute_ones = minute % 10
-        return hour_tens, hour_ones, minute_tens, minute_ones
-    
-    def _load_clock_image(self, digit_str: str) -> Optional[Image.Image]:
-        if digit_str in self._digit_cache:
-            return self._digit_cache[digit_str]
-
-        digit_path = os.path.join(self.clock_dir, f"{digit_str}")
-
-        print(f"Digit Path: {digit_path}")
-
-        try:
-            digit = Image.open(digit_path)
-            if digit.mode != 'RGBA':
-                digit = digit.convert('RGBA')
-
-            max_width = int(self.display_width)
-            max_height = int(self.display_height)
-            digit.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-            self._digit_cache[digit_str] = digit
+    def _load_clock_image(self, digit_str: str) -> Image.Image:
+        """Return the preloaded sprite for a clock image filename."""
+        return self._rgb_cache[digit_str]
 
-        except Exception as e:
-            self.logger.error(f"Error loading digit {digit_str}: {e}", exc_info=True)
-            return None
+    def _blit(self, fb: np.ndarray, sprite: np.ndarray, x: int, y: int) -> None:
+        """Copy a sprite array into the framebuffer at (x, y); the slice
+        assignment is a single contiguous memcpy through NumPy's C path."""
+        h, w = sprite.shape[:2]
+        fb[y:y + h, x:x + w] = sprite
 
     def display_time_enhanced(self, force_clear: bool = False) -> None:
         """Display the current time and date."""
-        time_str, ampm, weekday, month_str, date_str = self.get_current_time()
-
-        # Only update if something has changed
-        if time_str != self.last_time or date_str != self.last_date or force_clear:
-            main_img = Image.new('RGBA', (self.display_width, self.display_height), (0, 0, 0, 255))
-            overlay = Image.new('RGBA', (self.display_width, self.display_height), (0, 0, 0, 0))
-
-            time_separator = self._load_clock_image("timeseparator.png")
-            overlay.paste(time_separator, (self.TIME_SEPARATOR_X, self.TIME_SEPARATOR_Y), time_separator)
-
-            if ampm.upper() == "AM":
-                ampm_img = self._load_clock_image("am.png")
-            else:
-                ampm_img = self._load_clock_image("pm.png")
-            
-            overlay.paste(ampm_img, (self.AM_PM_X, self.AM_PM_Y), ampm_img)
-
-            # Calculate positions
-            display_width = self.display_manager.matrix.width
-            display_height = self.display_manager.matrix.height
-            print(f"\nDisplay Height: {display_height}, Display Width: {display_width}")
-
-            # Break down time_str into hours and minutes to get correct images
-            new_hour_tens, new_hour_ones, new_minute_tens, new_minute_ones = self.time_str_to_decimal(time_str)
-            print(f"\nCurrent Time: {time_str}, Hour: {new_hour_tens*10 + new_hour_ones}, Minute: {new_minute_tens*10 + new_minute_ones}")
-
-            # Break down last_time into hours and minutes to see what needs to be updated
-            old_hour_tens, old_hour_ones, old_minute_tens, old_minute_ones = self.time_str_to_decimal(self.last_time)
-
-            hour_tens_updated = (new_hour_tens != old_hour_tens)
-            hour_ones_updated = (new_hour_ones != old_hour_ones)
-            minute_tens_updated = (new_minute_tens != old_minute_tens)
-            minute_ones_updated = (new_minute_ones != old_minute_ones)
-
-            # Clear any updated values
-            if hour_tens_updated:
-                blank_tens = self._load_clock_image(self.BLANK_NUMS[1])
-                main_img.paste(blank_tens, (self.HOUR_TENS_X, self.HOUR_TENS_Y), blank_tens)
-            if hour_ones_updated:
-                blank_ones = self._load_clock_image(self.BLANK_NUMS[0])
-                main_img.paste(blank_ones, (self.HOUR_ONES_X, self.HOUR_ONES_Y), blank_ones)   
-            if minute_tens_updated:
-                blank_ones = self._load_clock_image(self.BLANK_NUMS[0])
-                main_img.paste(blank_ones, (self.MINUTE_TENS_X, self.MINUTE_TENS_Y), blank_ones)     
-            if minute_ones_updated:
-                blank_ones = self._load_clock_image(self.BLANK_NUMS[0])
-                main_img.paste(blank_ones, (self.MINUTE_ONES_X, self.MINUTE_ONES_Y), blank_ones)  
-
-            # Composite and display
-            main_img = Image.alpha_composite(main_img, overlay)
-            main_img = main_img.convert('RGB')
-
-            # Update image to clear any updated compontents
-            self.display_manager.image.paste(main_img, (0, 0))
-            self.display_manager.update_display()
-
-            # Update digit image if necessary
-            if hour_tens_updated and new_hour_tens > 0:
-                hour_tens = self._load_clock_image(self.NUMBER_IMAGES[10])
-                main_img.paste(hour_tens, (self.HOUR_TENS_X, self.HOUR_TENS_Y), hour_tens)
-            elif new_hour_tens > 0:
-                hour_tens = self._load_clock_image(self.NUMBER_IMAGES[10])
-                main_img.paste(hour_tens, (self.HOUR_TENS_X, self.HOUR_TENS_Y), hour_tens)      
-          
-            if hour_ones_updated:
-                hour_ones = self._load_clock_image(self.NUMBER_IMAGES[new_hour_ones])
-                main_img.paste(hour_ones, (self.HOUR_ONES_X, self.HOUR_ONES_Y), hour_ones)
-            else:
-                hour_ones = self._load_clock_image(self.NUMBER_IMAGES[old_hour_ones])
-                main_img.paste(hour_ones, (self.HOUR_ONES_X, self.HOUR_ONES_Y), hour_ones)
+        hour12, minute, ampm, weekday, month_str, date_str = self.get_current_time()
 
-            if minute_tens_updated:
-                minute_tens = self._load_clock_image(self.NUMBER_IMAGES[new_minute_tens])
-                main_img.paste(minute_tens, (self.MINUTE_TENS_X, self.MINUTE_TENS_Y), minute_tens)
-            else:
-                minute_tens = self._load_clock_image(self.NUMBER_IMAGES[old_minute_tens])
-                main_img.paste(minute_tens, (self.MINUTE_TENS_X, self.MINUTE_TENS_Y), minute_tens) 
+        # Break the time down before any image work so unchanged ticks
+        # reduce to a tuple compare; the fields are already integers so a
+        # divmod replaces the old string round-trip
+        new_hour_tens, new_hour_ones = divmod(hour12, 10)
+        new_minute_tens, new_minute_ones = divmod(minute, 10)
+        new_digits = (new_hour_tens, new_hour_ones, new_minute_tens, new_minute_ones, ampm)
 
-            if minute_ones_updated:
-                minute_ones = self._load_clock_image(self.NUMBER_IMAGES[new_minute_ones])
-                main_img.paste(minute_ones, (self.MINUTE_ONES_X, self.MINUTE_ONES_Y), minute_ones)
+        # Only update if something has changed
+        if (new_digits == self._last_digits and date_str == self.last_date
+                and not force_clear):
+            return
+
+        # Guarded so the f-string isn't even built unless debug is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Redrawing clock: {hour12}:{minute:02d} {ampm}")
+
+        # Persistent framebuffer: the first frame draws the static separator,
+        # later frames only blit the slots whose digits actually changed
+        fb = self._framebuffer
+        if fb is None:
+            fb = np.zeros((self.display_height, self.display_width, 3), dtype=np.uint8)
+            self._blit(fb, self._sep_sprite, self.TIME_SEPARATOR_X, self.TIME_SEPARATOR_Y)
+            self._framebuffer = fb
+
+        # AM/PM only flips twice a day; repaint it when it actually changes
+        if ampm != self.last_ampm or force_clear:
+            self._blit(fb, self._am_sprite if ampm.upper() == "AM" else self._pm_sprite,
+                       self.AM_PM_X, self.AM_PM_Y)
+
+        # The previously rendered digits tell us which slots need updating
+        old_hour_tens, old_hour_ones, old_minute_tens, old_minute_ones = self._last_digits[:4]
+        if force_clear:
+            # Repaint every slot; the framebuffer may be stale after a mode switch
+            old_hour_tens = old_hour_ones = old_minute_tens = old_minute_ones = -1
+
+        # One pass over the four digit slots: blit only the ones whose value
+        # changed. The digits are fixed-width so the new glyph fully covers
+        # the old one, and the hour-tens slot swaps between the "1" glyph
+        # and its blank in 12-hour mode.
+        slots = (
+            (self.HOUR_TENS_X, self.HOUR_TENS_Y, new_hour_tens, old_hour_tens, True),
+            (self.HOUR_ONES_X, self.HOUR_ONES_Y, new_hour_ones, old_hour_ones, False),
+            (self.MINUTE_TENS_X, self.MINUTE_TENS_Y, new_minute_tens, old_minute_tens, False),
+            (self.MINUTE_ONES_X, self.MINUTE_ONES_Y, new_minute_ones, old_minute_ones, False),
+        )
+        for x, y, new, old, is_hour_tens in slots:
+            if new == old:
+                continue
+            if is_hour_tens:
+                sprite = self._digit_sprites[10] if new > 0 else self._blank_tens
             else:
-                minute_ones = self._load_clock_image(self.NUMBER_IMAGES[old_minute_ones])
-                main_img.paste(minute_ones, (self.MINUTE_ONES_X, self.MINUTE_ONES_Y), minute_ones)
-
-            main_img = main_img.convert('RGB') # Convert for display
-            
-            # Update image to clear any updated compontents
-            self.display_manager.image.paste(main_img, (0, 0))
-
-                        # Draw weekday on first line (small font)
-            self.display_manager.draw_text(
-                weekday,
-                x = self.DATE_X,
-                y = self.DATE_Y,  # First line of date
-                color=self.COLORS['date'],
-                small_font=True
-            )
-
-            # Draw month on second line (small font)
-            self.display_manager.draw_text(
-                month_str,
-                x = self.MONTH_X,
-                y = self.MONTH_Y,  # Second line of date
-                color=self.COLORS['date'],
-                small_font=True
-            )
-            
-            # Draw day on third line (small font)
-            self.display_manager.draw_text(
-                date_str,
-                x = self.WEEKDAY_X,
-                y = self.WEEKDAY_Y,  # third line of date
-                color=self.COLORS['date'],
-                small_font=True
-            )
-
-            self.display_manager.update_display()
-
-            # Update cache
-            self.last_time = time_str
-            self.last_date = date_str
+                sprite = self._digit_sprites[new]
+            self._blit(fb, sprite, x, y)
+
+        # Push the framebuffer in one blit; fromarray wraps the buffer
+        # without copying, so this is the only per-frame conversion
+        self.display_manager.image.paste(Image.fromarray(fb, 'RGB'), (0, 0))
+
+        # Draw weekday on first line (small font)
+        self.display_manager.draw_text(
+            weekday,
+            x = self.DATE_X,
+            y = self.DATE_Y,  # First line of date
+            color=self.COLORS['date'],
+            small_font=True
+        )
+
+        # Draw month on second line (small font)
+        self.display_manager.draw_text(
+            month_str,
+            x = self.MONTH_X,
+            y = self.MONTH_Y,  # Second line of date
+            color=self.COLORS['date'],
+            small_font=True
+        )
+        
+        # Draw day on third line (small font)
+        self.display_manager.draw_text(
+            date_str,
+            x = self.WEEKDAY_X,
+            y = self.WEEKDAY_Y,  # third line of date
+            color=self.COLORS['date'],
+            small_font=True
+        )
+
+        self.display_manager.update_display()
+
+        # Update cache
+        self.last_time = f"{hour12}:{minute:02d}"
+        self.last_date = date_str
+        self.last_ampm = ampm
+        self._last_digits = new_digits
 
 if __name__ == "__main__":
     clock = Clock()
+    # Bind the hot references once so the loop body skips the attribute
+    # and dict lookups every iteration
+    display = clock.display_time_enhanced
+    sleep = time.sleep
+    monotonic = time.monotonic
+    period = 60.0
     try:
+        # Draw immediately, then re-derive each deadline from the wall clock
+        # so the loop re-locks to the minute boundary after an NTP step,
+        # timedatectl change or suspend (the Pi has no RTC, so the first
+        # sync after boot can move the clock by minutes). Each wait still
+        # runs against the monotonic clock, so a wall-clock step mid-sleep
+        # can't trigger a burst of catch-up ticks, and the floor keeps a
+        # wake-up just before the boundary from busy-spinning.
+        display()
         while True:
-            clock.display_time_enhanced()
-            time.sleep(clock.clock_config.get('update_interval', 1))
+            now = datetime.now()
+            next_tick = monotonic() + max(0.05, period - now.second - now.microsecond / 1_000_000)
+            while True:
+                delay = next_tick - monotonic()
+                if delay <= 0:
+                    break
+                sleep(delay)
+            display()
     except KeyboardInterrupt:
         print("\nClock stopped by user")
     finally: